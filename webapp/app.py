@@ -6,16 +6,21 @@ without modifying the original code.
 import os
 import sys
 import json
+import time
 import uuid
 import asyncio
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import configparser
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple, Set
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
+import orjson
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, Response
 from pydantic import BaseModel
 
 # Add parent directory to path to import existing modules
@@ -23,19 +28,46 @@ SCREENER_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(SCREENER_ROOT))
 
 # Import existing Service Screener modules
-from utils.Config import Config
 import constants as _C
+from webapp.progress_bus import ProgressBus
+from webapp.static_files import PrecompressedStaticFiles
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run new tasks eagerly up to their first await (Python 3.12+), which saves
+    a scheduling round-trip for WebSocket sends and background scans that
+    finish or block straight away; older Pythons keep the default factory.
+    Scan progress is fanned out to this process's WebSocket clients while
+    the app is up.
+    """
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    await progress_bus.connect(broadcast_progress)
+    try:
+        yield
+    finally:
+        await progress_bus.disconnect()
+
 
 app = FastAPI(
     title="AWS Service Screener Web GUI",
     description="Web interface for AWS Service Screener",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Serve static frontend files (built React app)
+# Serve static frontend files (built React app), using the .br/.gz copies
+# produced by `npm run build` when the browser accepts them
 STATIC_DIR = Path(__file__).parent / "static"
 if STATIC_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+    app.mount("/assets", PrecompressedStaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+
+# Compress everything else (API JSON, report pages) on the fly; responses that
+# already carry a Content-Encoding, like the precompressed assets, pass through
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
 # CORS for frontend
 app.add_middleware(
@@ -46,11 +78,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Store for running scan jobs
-scan_jobs: Dict[str, Dict[str, Any]] = {}
+
+# Store for running scan jobs, least recently used first
+scan_jobs: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+# JSON text of each job, re-encoded once per change by update_job()
+scan_jobs_json: Dict[str, str] = {}
+
+# Finished jobs older than SCAN_JOB_TTL, or beyond the newest MAX_SCAN_JOBS,
+# are dropped when a new scan starts
+SCAN_JOB_TTL = timedelta(hours=24)
+MAX_SCAN_JOBS = 500
+
+# Job updates are published here and fanned out to WebSocket clients. Setting
+# SCREENER_REDIS_URL (e.g. redis://localhost:6379) relays them through Redis;
+# job state and SSO sessions still live in this process only.
+progress_bus = ProgressBus(os.environ.get("SCREENER_REDIS_URL"))
+
+# Longest screener output line read in one go (bytes); asyncio's default is 64 KiB
+SCAN_OUTPUT_LINE_LIMIT = 1024 * 1024
+
+# A WebSocket send or close taking longer than this means the client stopped
+# reading; the socket is dropped instead of holding up the job's updates (seconds)
+WS_SEND_TIMEOUT = 5
 
 # WebSocket connections for real-time updates
-websocket_connections: Dict[str, List[WebSocket]] = {}
+websocket_connections: Dict[str, Set[WebSocket]] = {}
 
 # Available services (from existing screener)
 AVAILABLE_SERVICES = [
@@ -105,6 +158,11 @@ FRAMEWORKS = [
     {"id": "SSB", "name": "AWS Startup Security Baseline"},
 ]
 
+# The lists above never change at runtime, so their JSON bodies are encoded once
+_SERVICES_BODY = orjson.dumps({"services": AVAILABLE_SERVICES})
+_REGIONS_BODY = orjson.dumps({"regions": AWS_REGIONS})
+_FRAMEWORKS_BODY = orjson.dumps({"frameworks": FRAMEWORKS})
+
 
 # Pydantic models
 class ScanRequest(BaseModel):
@@ -140,8 +198,69 @@ class SSORoleCredentialsRequest(BaseModel):
     region: Optional[str] = "us-east-1"
 
 
-# Import SSO handler
-from webapp.sso_auth import sso_handler
+# SSO state lives in one handler per browser session, so concurrent users or
+# tabs can't clobber each other's device flow, token or credentials
+from webapp.sso_auth import SSOAuthHandler
+
+SSO_SESSION_HEADER = "X-Screener-Session"
+SSO_SESSION_COOKIE = "screener_session"
+
+# Sessions idle for longer than this are dropped when a new one is created (seconds)
+SSO_SESSION_IDLE_TTL = 12 * 60 * 60
+
+# Hard cap on stored sessions; the least recently used are dropped beyond it
+MAX_SSO_SESSIONS = 1000
+
+# Sessions by id, least recently used first
+sso_sessions: OrderedDict[str, SSOAuthHandler] = OrderedDict()
+
+
+def _lookup_sso_session(request: Request, response: Response) -> Tuple[Optional[str], Optional[SSOAuthHandler]]:
+    """Find the caller's stored session from the session header or cookie"""
+    header_id = request.headers.get(SSO_SESSION_HEADER)
+    session_id = header_id or request.cookies.get(SSO_SESSION_COOKIE)
+    handler = sso_sessions.get(session_id) if session_id else None
+    if handler is None:
+        return None, None
+    
+    handler.last_used = time.monotonic()
+    sso_sessions.move_to_end(session_id)
+    # Only header clients need the id back; cookie clients keep it httponly
+    if header_id:
+        response.headers[SSO_SESSION_HEADER] = session_id
+    return session_id, handler
+
+
+def get_sso_handler(request: Request, response: Response) -> SSOAuthHandler:
+    """
+    Resolve the caller's SSO handler. Callers without a known session get a
+    throwaway, unauthenticated handler; only /api/sso/start stores sessions.
+    Runs on the event loop thread only, so the dict needs no lock.
+    """
+    _, handler = _lookup_sso_session(request, response)
+    return handler if handler is not None else SSOAuthHandler()
+
+
+def create_sso_handler(request: Request, response: Response) -> SSOAuthHandler:
+    """Resolve the caller's SSO handler, starting a new session when there is none"""
+    _, handler = _lookup_sso_session(request, response)
+    if handler is not None:
+        return handler
+    
+    now = time.monotonic()
+    for stale_id in [sid for sid, h in sso_sessions.items() if now - h.last_used > SSO_SESSION_IDLE_TTL]:
+        del sso_sessions[stale_id]
+    while len(sso_sessions) >= MAX_SSO_SESSIONS:
+        sso_sessions.popitem(last=False)
+    
+    session_id = uuid.uuid4().hex
+    handler = sso_sessions[session_id] = SSOAuthHandler()
+    handler.last_used = now
+    
+    if request.headers.get(SSO_SESSION_HEADER) is not None:
+        response.headers[SSO_SESSION_HEADER] = session_id
+    response.set_cookie(SSO_SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    return handler
 
 
 # API Endpoints
@@ -154,35 +273,53 @@ async def health_check():
 @app.get("/api/services")
 async def get_services():
     """Get list of available AWS services to scan"""
-    return {"services": AVAILABLE_SERVICES}
+    return Response(content=_SERVICES_BODY, media_type="application/json")
 
 
 @app.get("/api/regions")
 async def get_regions():
     """Get list of AWS regions"""
-    return {"regions": AWS_REGIONS}
+    return Response(content=_REGIONS_BODY, media_type="application/json")
 
 
 @app.get("/api/frameworks")
 async def get_frameworks():
     """Get list of compliance frameworks"""
-    return {"frameworks": FRAMEWORKS}
+    return Response(content=_FRAMEWORKS_BODY, media_type="application/json")
+
+
+# Last parse of ~/.aws/credentials, keyed on file mtime
+_profile_cache: Optional[Tuple[float, List[str]]] = None
 
 
 @app.get("/api/aws-profiles")
 async def get_aws_profiles():
     """Get available AWS profiles from ~/.aws/credentials"""
+    global _profile_cache
+    
     profiles = ["default"]
     credentials_file = Path.home() / ".aws" / "credentials"
     
-    if credentials_file.exists():
-        try:
-            content = credentials_file.read_text()
-            import re
-            profile_matches = re.findall(r'\[([^\]]+)\]', content)
-            profiles = list(set(profiles + profile_matches))
-        except Exception:
-            pass
+    try:
+        mtime = credentials_file.stat().st_mtime
+    except OSError:
+        return {"profiles": profiles}
+    
+    if _profile_cache and _profile_cache[0] == mtime:
+        return {"profiles": _profile_cache[1]}
+    
+    # strict=False tolerates duplicate profiles; on a malformed line the
+    # sections parsed so far are still usable
+    parser = configparser.RawConfigParser(strict=False)
+    try:
+        parser.read(credentials_file)
+    except configparser.ParsingError:
+        pass
+    except Exception:
+        return {"profiles": profiles}
+    
+    profiles = sorted(set(profiles + parser.sections()))
+    _profile_cache = (mtime, profiles)
     
     return {"profiles": profiles}
 
@@ -190,7 +327,7 @@ async def get_aws_profiles():
 # ============ SSO Authentication Endpoints ============
 
 @app.get("/api/sso/status")
-async def sso_status():
+async def sso_status(sso_handler: SSOAuthHandler = Depends(get_sso_handler)):
     """Check SSO authentication status"""
     return {
         "authenticated": sso_handler.is_authenticated(),
@@ -199,13 +336,14 @@ async def sso_status():
 
 
 @app.post("/api/sso/start")
-async def sso_start(request: SSOStartRequest):
+async def sso_start(request: SSOStartRequest, sso_handler: SSOAuthHandler = Depends(create_sso_handler)):
     """
     Start SSO device authorization flow.
     Returns a URL that user needs to visit to complete login.
     """
     try:
-        auth_info = sso_handler.start_device_authorization(
+        auth_info = await asyncio.to_thread(
+            sso_handler.start_device_authorization,
             start_url=request.start_url,
             region=request.region
         )
@@ -225,46 +363,47 @@ async def sso_start(request: SSOStartRequest):
 
 
 @app.post("/api/sso/poll")
-async def sso_poll():
+async def sso_poll(sso_handler: SSOAuthHandler = Depends(get_sso_handler)):
     """Poll to check if user completed SSO login"""
     # Use the region that was set during start_device_authorization
     if not sso_handler.current_region:
         return {"status": "error", "message": "No SSO login in progress. Please start SSO login first."}
     if not sso_handler.client_id:
         return {"status": "error", "message": "SSO client not registered. Please restart SSO login."}
-    result = sso_handler.poll_for_token(sso_handler.current_region)
+    result = await asyncio.to_thread(sso_handler.poll_for_token, sso_handler.current_region)
     return result
 
 
 @app.get("/api/sso/accounts")
-async def sso_list_accounts():
+async def sso_list_accounts(sso_handler: SSOAuthHandler = Depends(get_sso_handler)):
     """List AWS accounts available after SSO login"""
     if not sso_handler.is_authenticated():
         return {"error": "Not authenticated", "accounts": []}
     
     region = sso_handler.current_region or "us-east-1"
-    accounts = sso_handler.list_accounts(region)
+    accounts = await asyncio.to_thread(sso_handler.list_accounts, region)
     return {"accounts": accounts}
 
 
 @app.get("/api/sso/accounts/{account_id}/roles")
-async def sso_list_roles(account_id: str):
+async def sso_list_roles(account_id: str, sso_handler: SSOAuthHandler = Depends(get_sso_handler)):
     """List roles available for a specific account"""
     if not sso_handler.is_authenticated():
         return {"error": "Not authenticated", "roles": []}
     
     region = sso_handler.current_region or "us-east-1"
-    roles = sso_handler.list_account_roles(account_id, region)
+    roles = await asyncio.to_thread(sso_handler.list_account_roles, account_id, region)
     return {"roles": roles}
 
 
 @app.post("/api/sso/credentials")
-async def sso_get_credentials(request: SSORoleCredentialsRequest):
+async def sso_get_credentials(request: SSORoleCredentialsRequest, sso_handler: SSOAuthHandler = Depends(get_sso_handler)):
     """Get temporary credentials for a role (used for scanning)"""
     if not sso_handler.is_authenticated():
         return {"error": "Not authenticated"}
     
-    creds = sso_handler.get_role_credentials(
+    creds = await asyncio.to_thread(
+        sso_handler.get_role_credentials,
         account_id=request.account_id,
         role_name=request.role_name,
         region=request.region
@@ -277,7 +416,11 @@ sso_credentials: Dict[str, Any] = {}
 
 
 @app.post("/api/scan", response_model=ScanJob)
-async def start_scan(request: ScanRequest, background_tasks: BackgroundTasks):
+async def start_scan(
+    request: ScanRequest,
+    background_tasks: BackgroundTasks,
+    sso_handler: SSOAuthHandler = Depends(get_sso_handler)
+):
     """Start a new scan job"""
     job_id = str(uuid.uuid4())[:8]
     
@@ -292,9 +435,11 @@ async def start_scan(request: ScanRequest, background_tasks: BackgroundTasks):
         "error": None,
         "request": request.dict()
     }
+    update_job(job_id)
+    expire_scan_jobs()
     
     # Start scan in background
-    background_tasks.add_task(run_scan, job_id, request)
+    background_tasks.add_task(run_scan, job_id, request, sso_handler)
     
     return ScanJob(**scan_jobs[job_id])
 
@@ -305,6 +450,7 @@ async def get_scan_status(job_id: str):
     if job_id not in scan_jobs:
         raise HTTPException(status_code=404, detail="Scan job not found")
     
+    scan_jobs.move_to_end(job_id)
     return ScanJob(**scan_jobs[job_id])
 
 
@@ -314,24 +460,63 @@ async def list_scans():
     return {"scans": list(scan_jobs.values())}
 
 
+# Last report listing, keyed on the reports directory mtime (ns)
+_reports_cache: Optional[Tuple[int, List[Dict[str, str]]]] = None
+
+
+def _scan_reports_sync(reports_dir: Path) -> Tuple[List[Dict[str, str]], bool]:
+    """
+    Collect generated reports, newest first (blocking, run in a thread).
+    Also tells whether every account folder had its index.html yet; a folder
+    still being written doesn't change the parent's mtime when it is finished.
+    """
+    reports = []
+    complete = True
+    
+    # scandir answers is_dir() from the directory entry itself, leaving a
+    # single stat per account for index.html
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            if not (entry.name.isdigit() and entry.is_dir(follow_symlinks=False)):
+                continue
+            
+            try:
+                index_stat = os.stat(os.path.join(entry.path, "index.html"))
+            except FileNotFoundError:
+                complete = False
+                continue
+            
+            reports.append({
+                "account_id": entry.name,
+                "path": f"/reports/{entry.name}/index.html",
+                "created_at": datetime.fromtimestamp(index_stat.st_mtime).isoformat()
+            })
+    
+    return sorted(reports, key=lambda x: x["created_at"], reverse=True), complete
+
+
 @app.get("/api/reports")
 async def list_reports():
     """List available reports"""
-    reports = []
+    global _reports_cache
+    
     reports_dir = SCREENER_ROOT / "adminlte" / "aws"
     
-    if reports_dir.exists():
-        for account_dir in reports_dir.iterdir():
-            if account_dir.is_dir() and account_dir.name.isdigit():
-                index_file = account_dir / "index.html"
-                if index_file.exists():
-                    reports.append({
-                        "account_id": account_dir.name,
-                        "path": f"/reports/{account_dir.name}/index.html",
-                        "created_at": datetime.fromtimestamp(index_file.stat().st_mtime).isoformat()
-                    })
+    # Adding or removing an account folder bumps the directory mtime. Writing
+    # index.html inside an existing folder doesn't, so listings with a folder
+    # still missing its report are not cached, and run_scan drops the cache
+    # once the screener exits
+    try:
+        key = reports_dir.stat().st_mtime_ns
+    except OSError:
+        return {"reports": []}
     
-    return {"reports": sorted(reports, key=lambda x: x["created_at"], reverse=True)}
+    if _reports_cache and _reports_cache[0] == key:
+        return {"reports": _reports_cache[1]}
+    
+    reports, complete = await asyncio.to_thread(_scan_reports_sync, reports_dir)
+    _reports_cache = (key, reports) if complete else None
+    return {"reports": reports}
 
 
 # WebSocket for real-time scan progress
@@ -339,42 +524,151 @@ async def list_reports():
 async def websocket_scan_progress(websocket: WebSocket, job_id: str):
     await websocket.accept()
     
-    if job_id not in websocket_connections:
-        websocket_connections[job_id] = []
-    websocket_connections[job_id].append(websocket)
+    websocket_connections.setdefault(job_id, set()).add(websocket)
     
     try:
+        # Send the current state, from this process's job table or else the
+        # last update the bus relayed; later changes arrive through
+        # broadcast_progress
+        job = scan_jobs.get(job_id)
+        if job:
+            snapshot = (scan_jobs_json[job_id], job["status"] in ["completed", "failed"])
+        else:
+            snapshot = progress_bus.latest(job_id)
+        
+        if snapshot is None:
+            await websocket.close(code=1008, reason="Unknown scan job")
+            return
+        
+        payload, final = snapshot
+        await websocket.send_text(payload)
+        if final:
+            await websocket.close()
+            return
+        
+        # Clients aren't expected to send anything; ignore text or binary
+        # frames and return once the socket closes
         while True:
-            if job_id in scan_jobs:
-                job = scan_jobs[job_id]
-                await websocket.send_json(job)
-                
-                if job["status"] in ["completed", "failed"]:
-                    break
-            
-            await asyncio.sleep(1)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        websocket_connections[job_id].remove(websocket)
+        pass
+    finally:
+        conns = websocket_connections.get(job_id)
+        if conns:
+            conns.discard(websocket)
+            if not conns:
+                websocket_connections.pop(job_id, None)
+
+
+async def broadcast_progress(job_id: str, payload: str, final: bool = False):
+    """Broadcast an encoded job update to all connected WebSocket clients"""
+    conns = list(websocket_connections.get(job_id, ()))
+    if not conns:
+        return
+    
+    # Send concurrently, so one slow client doesn't hold up the rest, and give
+    # up on clients that have stopped reading
+    results = await asyncio.gather(
+        *(asyncio.wait_for(ws.send_text(payload), WS_SEND_TIMEOUT) for ws in conns),
+        return_exceptions=True
+    )
+    
+    # Forget sockets that failed or timed out; their clients are gone
+    dead = {ws for ws, result in zip(conns, results) if isinstance(result, BaseException)}
+    alive = websocket_connections.get(job_id, set()) - dead
+    
+    # Finished jobs send nothing more, let their clients go
+    if final:
+        websocket_connections.pop(job_id, None)
+        closing = dead | alive
+    else:
+        if alive:
+            websocket_connections[job_id] = alive
+        else:
+            websocket_connections.pop(job_id, None)
+        closing = dead
+    
+    # Closing also ends each socket's websocket_scan_progress handler, which
+    # would otherwise wait on a stalled client forever
+    if closing:
+        await asyncio.gather(
+            *(asyncio.wait_for(ws.close(), WS_SEND_TIMEOUT) for ws in closing),
+            return_exceptions=True
+        )
 
 
-async def broadcast_progress(job_id: str, data: dict):
-    """Broadcast progress to all connected WebSocket clients"""
-    if job_id in websocket_connections:
-        for ws in websocket_connections[job_id]:
-            try:
-                await ws.send_json(data)
-            except:
-                pass
+def expire_scan_jobs():
+    """
+    Keep the job table bounded: drop finished jobs older than SCAN_JOB_TTL,
+    then the least recently used finished ones past MAX_SCAN_JOBS.
+    Pending and running jobs are never dropped.
+    """
+    cutoff = (datetime.now() - SCAN_JOB_TTL).isoformat()
+    finished = [
+        job_id for job_id, job in scan_jobs.items()
+        if job["status"] in ["completed", "failed"]
+    ]
+    expired = {job_id for job_id in finished if scan_jobs[job_id]["created_at"] < cutoff}
+    
+    # finished is in LRU order, so the overflow comes off its front
+    overflow = len(scan_jobs) - len(expired) - MAX_SCAN_JOBS
+    if overflow > 0:
+        expired.update([job_id for job_id in finished if job_id not in expired][:overflow])
+    
+    for job_id in expired:
+        scan_jobs.pop(job_id, None)
+        scan_jobs_json.pop(job_id, None)
+        websocket_connections.pop(job_id, None)
 
 
-async def run_scan(job_id: str, request: ScanRequest):
-    """Run the actual scan using existing Service Screener"""
-    import subprocess
+def update_job(job_id: str, **fields):
+    """Update a scan job and publish the new state to WebSocket clients"""
+    job = scan_jobs[job_id]
+    job.update(fields)
     
+    # Encode once here; every subscriber in every worker reuses this text
+    payload = scan_jobs_json[job_id] = orjson.dumps(job).decode()
+    progress_bus.publish(job_id, payload, final=job["status"] in ["completed", "failed"])
+
+
+async def _read_output_lines(stream: asyncio.StreamReader):
+    """
+    Yield the screener's output line by line. Lines longer than
+    SCAN_OUTPUT_LINE_LIMIT are cut at the limit and the rest is skipped,
+    instead of failing the scan.
+    """
+    skipping = False
+    while True:
+        try:
+            chunk = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # End of output; the last line may lack a newline
+            if e.partial and not skipping:
+                yield e.partial
+            return
+        except asyncio.LimitOverrunError as e:
+            chunk = await stream.read(max(e.consumed, 1))
+            if not skipping:
+                yield chunk[:SCAN_OUTPUT_LINE_LIMIT]
+            skipping = True
+            continue
+        
+        if not skipping:
+            yield chunk
+        skipping = False
+
+
+async def run_scan(job_id: str, request: ScanRequest, sso_handler: SSOAuthHandler):
+    """Run the actual scan using existing Service Screener"""
     try:
-        scan_jobs[job_id]["status"] = "running"
-        scan_jobs[job_id]["current_task"] = "Preparing scan..."
-        scan_jobs[job_id]["progress"] = 5
+        update_job(
+            job_id,
+            status="running",
+            current_task="Preparing scan...",
+            progress=5
+        )
         
         # Build command to run existing CLI
         cmd = [
@@ -387,25 +681,30 @@ async def run_scan(job_id: str, request: ScanRequest):
         if request.frameworks:
             cmd.extend(["--frameworks", ",".join(request.frameworks)])
         
-        # Set up environment
+        # Set up environment for the child process only; os.environ is
+        # process-global and must not be touched while other scans run
         env = os.environ.copy()
         
         # Check if using SSO credentials
         if request.use_sso and sso_handler.is_authenticated():
-            scan_jobs[job_id]["current_task"] = "Getting SSO credentials..."
+            update_job(job_id, current_task="Getting SSO credentials...")
             
             if request.sso_account_id and request.sso_role_name:
                 # Get temporary credentials from SSO
                 region = sso_handler.current_region or "us-east-1"
-                creds = sso_handler.get_role_credentials(
+                creds = await asyncio.to_thread(
+                    sso_handler.get_role_credentials,
                     account_id=request.sso_account_id,
                     role_name=request.sso_role_name,
                     region=region
                 )
                 
                 if "error" in creds:
-                    scan_jobs[job_id]["status"] = "failed"
-                    scan_jobs[job_id]["error"] = f"Failed to get SSO credentials: {creds['error']}"
+                    update_job(
+                        job_id,
+                        status="failed",
+                        error=f"Failed to get SSO credentials: {creds['error']}"
+                    )
                     return
                 
                 # Set AWS credentials as environment variables
@@ -415,26 +714,32 @@ async def run_scan(job_id: str, request: ScanRequest):
                 # Remove any conflicting profile setting
                 env.pop("AWS_PROFILE", None)
                 
-                scan_jobs[job_id]["current_task"] = f"SSO credentials obtained for account {request.sso_account_id}"
+                update_job(job_id, current_task=f"SSO credentials obtained for account {request.sso_account_id}")
             else:
-                scan_jobs[job_id]["status"] = "failed"
-                scan_jobs[job_id]["error"] = "SSO login detected but no account/role selected. Please select an account and role."
+                update_job(
+                    job_id,
+                    status="failed",
+                    error="SSO login detected but no account/role selected. Please select an account and role."
+                )
                 return
         elif request.aws_profile:
             # Use AWS profile
             env["AWS_PROFILE"] = request.aws_profile
         
-        scan_jobs[job_id]["current_task"] = f"Scanning {len(request.services)} services in {len(request.regions)} regions..."
-        scan_jobs[job_id]["progress"] = 10
+        update_job(
+            job_id,
+            current_task=f"Scanning {len(request.services)} services in {len(request.regions)} regions...",
+            progress=10
+        )
         
         # Run the scan
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             cwd=str(SCREENER_ROOT),
             env=env,
-            text=True
+            limit=SCAN_OUTPUT_LINE_LIMIT
         )
         
         # Read output and update progress
@@ -442,59 +747,99 @@ async def run_scan(job_id: str, request: ScanRequest):
         services_scanned = 0
         output_lines = []
         
-        for line in iter(process.stdout.readline, ''):
-            if not line:
-                break
-            
-            # Store output for debugging
-            output_lines.append(line.strip())
-            print(f"[SCAN {job_id}] {line.strip()}")  # Log to console
+        try:
+            async for raw_line in _read_output_lines(process.stdout):
+                line = raw_line.decode(errors="replace")
+                
+                # Store output for debugging
+                output_lines.append(line.strip())
+                print(f"[SCAN {job_id}] {line.strip()}")  # Log to console
+                
+                # Update progress based on output
+                if "Processing" in line or "Scanning" in line:
+                    services_scanned += 1
+                    progress = min(10 + int((services_scanned / total_services) * 80), 90)
+                    update_job(job_id, progress=progress, current_task=line.strip()[:100])
             
-            # Update progress based on output
-            if "Processing" in line or "Scanning" in line:
-                services_scanned += 1
-                progress = min(10 + int((services_scanned / total_services) * 80), 90)
-                scan_jobs[job_id]["progress"] = progress
-                scan_jobs[job_id]["current_task"] = line.strip()[:100]
+            returncode = await process.wait()
+        finally:
+            # Don't leave the screener running, blocked on a pipe nobody
+            # reads, when reading fails or the scan task is cancelled
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                await process.wait()
         
-        process.wait()
+        # The screener may have written reports into existing account folders
+        global _reports_cache
+        _reports_cache = None
         
-        if process.returncode == 0:
-            scan_jobs[job_id]["status"] = "completed"
-            scan_jobs[job_id]["progress"] = 100
-            scan_jobs[job_id]["current_task"] = "Scan completed successfully"
-            scan_jobs[job_id]["completed_at"] = datetime.now().isoformat()
-            
+        if returncode == 0:
             # Find the generated report
+            report_path = None
             reports_dir = SCREENER_ROOT / "adminlte" / "aws"
             if reports_dir.exists():
                 for account_dir in reports_dir.iterdir():
                     if account_dir.is_dir() and account_dir.name.isdigit():
-                        scan_jobs[job_id]["report_path"] = f"/reports/{account_dir.name}/index.html"
+                        report_path = f"/reports/{account_dir.name}/index.html"
                         break
+            
+            update_job(
+                job_id,
+                status="completed",
+                progress=100,
+                current_task="Scan completed successfully",
+                completed_at=datetime.now().isoformat(),
+                report_path=report_path
+            )
         else:
-            scan_jobs[job_id]["status"] = "failed"
             # Get last few lines of output for error message
             error_output = "\n".join(output_lines[-10:]) if output_lines else "No output"
-            scan_jobs[job_id]["error"] = f"Scan failed (exit code {process.returncode}). Last output:\n{error_output}"
+            update_job(
+                job_id,
+                status="failed",
+                error=f"Scan failed (exit code {returncode}). Last output:\n{error_output}"
+            )
             
     except Exception as e:
         import traceback
         traceback.print_exc()
-        scan_jobs[job_id]["status"] = "failed"
-        scan_jobs[job_id]["error"] = str(e)
+        update_job(
+            job_id,
+            status="failed",
+            error=str(e)
+        )
+
+
+# Reports change whenever a scan reruns, so browsers revalidate after a minute
+REPORT_CACHE_CONTROL = "public, max-age=60"
 
 
 # Serve static report files
 @app.get("/reports/{account_id}/{file_path:path}")
-async def serve_report(account_id: str, file_path: str):
+async def serve_report(account_id: str, file_path: str, request: Request):
     """Serve generated HTML reports"""
     report_file = SCREENER_ROOT / "adminlte" / "aws" / account_id / file_path
     
-    if not report_file.exists():
+    try:
+        st = report_file.stat()
+    except OSError:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    return FileResponse(report_file)
+    # Weak validator from mtime/size: reports are rewritten in place by every
+    # scan, and the body may be gzipped on the way out
+    etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers=headers)
+    
+    return FileResponse(report_file, stat_result=st, headers=headers)
 
 
 # Serve frontend index.html for root and SPA routes
@@ -514,4 +859,12 @@ async def serve_frontend():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets"
+    )
@@ -0,0 +1,31 @@
+// Write .br and .gz copies of the built assets next to the originals so the
+// backend can serve them without compressing on every request.
+import { readdirSync, readFileSync, writeFileSync, statSync } from 'node:fs'
+import { join, extname } from 'node:path'
+import { brotliCompressSync, gzipSync, constants } from 'node:zlib'
+import { fileURLToPath } from 'node:url'
+
+const ASSETS_DIR = fileURLToPath(new URL('../dist/assets', import.meta.url))
+const COMPRESSIBLE = new Set(['.js', '.css', '.svg', '.html', '.json'])
+const MIN_SIZE = 1024
+
+function walk(dir) {
+    for (const name of readdirSync(dir)) {
+        const path = join(dir, name)
+        if (statSync(path).isDirectory()) {
+            walk(path)
+            continue
+        }
+        if (!COMPRESSIBLE.has(extname(name))) continue
+
+        const data = readFileSync(path)
+        if (data.length < MIN_SIZE) continue
+
+        writeFileSync(`${path}.br`, brotliCompressSync(data, {
+            params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY }
+        }))
+        writeFileSync(`${path}.gz`, gzipSync(data, { level: 9 }))
+    }
+}
+
+walk(ASSETS_DIR)
@@ -0,0 +1,181 @@
+"""
+Scan Progress Pub/Sub
+Carries scan job updates from the scan that produced them to the WebSocket
+clients watching that job, which may live in another uvicorn worker.
+"""
+import asyncio
+from collections import deque, OrderedDict
+from typing import Optional, Callable, Awaitable, List, Dict, Deque, Set, Tuple
+
+# Redis channel per job: scan:<job_id>, and scan:<job_id>:final for its last update
+CHANNEL_PREFIX = "scan:"
+FINAL_SUFFIX = ":final"
+
+# Latest update kept per job for clients that connect mid-scan, newest jobs kept
+MAX_LATEST_UPDATES = 500
+
+# Seconds to wait before re-subscribing after losing Redis, doubling up to the max
+LISTEN_RETRY_DELAY = 1
+LISTEN_RETRY_MAX_DELAY = 30
+
+# Receives (job_id, payload, final) for every update delivered to this process,
+# where payload is the job already encoded as JSON text
+ProgressHandler = Callable[[str, str, bool], Awaitable[None]]
+
+
+class ProgressBus:
+    """
+    Publishes job updates in order and hands them to a local handler.
+    Each job is delivered by its own task, so a handler stuck on one job's
+    clients never delays the updates of another job.
+    Without a Redis URL updates are delivered inside this process only; with
+    one they go through Redis pub/sub, so every worker subscribed to
+    scan:* fans them out to its own WebSocket clients.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url
+        self._handler: Optional[ProgressHandler] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # Updates waiting for delivery per job, and the tasks delivering them
+        self._pending: Dict[str, Deque[Tuple[str, bool]]] = {}
+        self._deliveries: Set[asyncio.Task] = set()
+        # Last (payload, final) seen per job, least recently updated first
+        self._latest: "OrderedDict[str, Tuple[str, bool]]" = OrderedDict()
+        self._redis = None
+        self._pubsub = None
+
+    async def connect(self, handler: ProgressHandler):
+        """Start delivering updates to handler (call once per process on startup)"""
+        self._handler = handler
+        self._queue = asyncio.Queue()
+
+        if self.redis_url:
+            # Optional dependency, only needed for multi-worker deployments
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+            self._pubsub = self._redis.pubsub()
+            await self._pubsub.psubscribe(CHANNEL_PREFIX + "*")
+            self._tasks.append(asyncio.create_task(self._listen()))
+
+        self._tasks.append(asyncio.create_task(self._drain()))
+
+    async def disconnect(self):
+        """Stop background tasks and close the Redis connection if any"""
+        tasks = self._tasks + list(self._deliveries)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._deliveries.clear()
+        self._pending.clear()
+        self._queue = None
+
+        await self._close_pubsub()
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def publish(self, job_id: str, payload: str, final: bool = False):
+        """
+        Queue an encoded job update; final marks the job's last one.
+        Plain function so it can be called from sync code on the event loop;
+        a single drain task keeps updates in order.
+        """
+        if self._queue is not None:
+            self._queue.put_nowait((job_id, payload, final))
+
+    def latest(self, job_id: str) -> Optional[Tuple[str, bool]]:
+        """Last (payload, final) delivered for a job, wherever it runs, if still known"""
+        return self._latest.get(job_id)
+
+    async def _drain(self):
+        while True:
+            job_id, payload, final = await self._queue.get()
+            try:
+                if self._redis is not None:
+                    channel = CHANNEL_PREFIX + job_id + (FINAL_SUFFIX if final else "")
+                    await self._redis.publish(channel, payload)
+                else:
+                    self._dispatch(job_id, payload, final)
+            except Exception as e:
+                print(f"Error publishing progress for job {job_id}: {e}")
+
+    def _dispatch(self, job_id: str, payload: str, final: bool):
+        """Hand an update to the job's delivery task, starting one if idle"""
+        self._latest[job_id] = (payload, final)
+        self._latest.move_to_end(job_id)
+        while len(self._latest) > MAX_LATEST_UPDATES:
+            self._latest.popitem(last=False)
+
+        pending = self._pending.get(job_id)
+        if pending is not None:
+            pending.append((payload, final))
+            return
+
+        pending = self._pending[job_id] = deque([(payload, final)])
+        task = asyncio.create_task(self._deliver(job_id, pending))
+        if not task.done():
+            self._deliveries.add(task)
+            task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, job_id: str, pending: Deque[Tuple[str, bool]]):
+        try:
+            while pending:
+                payload, final = pending.popleft()
+                try:
+                    await self._handler(job_id, payload, final)
+                except Exception as e:
+                    print(f"Error delivering progress for job {job_id}: {e}")
+        finally:
+            if self._pending.get(job_id) is pending:
+                del self._pending[job_id]
+
+    async def _listen(self):
+        """Deliver updates from Redis, re-subscribing whenever the connection drops"""
+        delay = LISTEN_RETRY_DELAY
+        while True:
+            try:
+                if self._pubsub is None:
+                    self._pubsub = self._redis.pubsub()
+                    await self._pubsub.psubscribe(CHANNEL_PREFIX + "*")
+
+                async for message in self._pubsub.listen():
+                    delay = LISTEN_RETRY_DELAY
+                    if message["type"] == "pmessage":
+                        self._on_message(message)
+                error = "subscription closed"
+            except Exception as e:
+                error = e
+
+            print(f"Lost Redis progress subscription ({error}), retrying in {delay}s")
+            await self._close_pubsub()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LISTEN_RETRY_MAX_DELAY)
+
+    def _on_message(self, message):
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+
+        job_id = channel[len(CHANNEL_PREFIX):]
+        final = job_id.endswith(FINAL_SUFFIX)
+        if final:
+            job_id = job_id[:-len(FINAL_SUFFIX)]
+
+        payload = message["data"]
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+
+        self._dispatch(job_id, payload, final)
+
+    async def _close_pubsub(self):
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.aclose()
+        except Exception:
+            pass
+        self._pubsub = None
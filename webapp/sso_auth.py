@@ -6,10 +6,55 @@ import os
 import json
 import time
 import re
-import boto3
+import functools
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+# How long account/role listings are reused before asking SSO again (seconds)
+LISTING_CACHE_TTL = 300
+
+# Role credentials closer than this to expiring are fetched again (milliseconds)
+CREDENTIALS_EXPIRY_MARGIN_MS = 60_000
+
+# Regional indicators recognised in SSO start URLs
+_REGION_RE = re.compile(r'\b(us-east-[12]|us-west-2|eu-west-1|eu-central-1|ap-southeast-1|ap-northeast-1)\b')
+
+# Bounded retries and timeouts so a slow SSO endpoint can't hang an API request
+_SSO_CLIENT_CONFIG_ARGS = {
+    'retries': {'max_attempts': 3, 'mode': 'standard'},
+    'connect_timeout': 3,
+    'read_timeout': 10
+}
+
+# One boto3 session per region, shared by every handler so the endpoint data and
+# credential chain are resolved once. Sessions aren't thread-safe, hence the lock.
+_sessions_by_region: Dict[str, Any] = {}
+_sessions_lock = threading.Lock()
+
+
+def _create_client(service_name: str, region: str):
+    """Create a client for service_name from the shared session for region"""
+    # boto3 takes hundreds of ms to import; defer it until SSO is actually used
+    import boto3
+    from botocore.config import Config as BotoConfig
+    
+    with _sessions_lock:
+        session = _sessions_by_region.get(region)
+        if session is None:
+            session = _sessions_by_region[region] = boto3.Session(region_name=region)
+        return session.client(service_name, config=BotoConfig(**_SSO_CLIENT_CONFIG_ARGS))
+
+
+def _synchronized(method):
+    """Run a handler method under the handler's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 # SSO OIDC client for device authorization flow
 class SSOAuthHandler:
@@ -22,7 +67,17 @@ class SSOAuthHandler:
         self.access_token = None
         self.token_expiry = None
         self.current_region = None
+        # Account/role listings keyed by access token, as (fetched_at, items)
+        self._accounts_cache: Dict[str, Tuple[float, list]] = {}
+        self._roles_cache: Dict[Tuple[str, str], Tuple[float, list]] = {}
+        # Role credentials keyed by (access_token, account_id, role_name), reused until near expiration
+        self._creds_cache: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        # One handler per browser session; the web API and scan threads may
+        # use it at the same time, and methods call each other (re-entrant)
+        self._lock = threading.RLock()
+        self.last_used = time.monotonic()
         
+    @_synchronized
     def get_sso_oidc_client(self, region: str):
         """Get SSO OIDC client for the specified region"""
         # Reset client if region changed
@@ -34,13 +89,14 @@ class SSOAuthHandler:
             self.current_region = region
             
         if not self.sso_oidc_client:
-            self.sso_oidc_client = boto3.client('sso-oidc', region_name=region)
+            self.sso_oidc_client = _create_client('sso-oidc', region)
         return self.sso_oidc_client
     
+    @_synchronized
     def get_sso_client(self, region: str):
         """Get SSO client for the specified region"""
         if not self.sso_client:
-            self.sso_client = boto3.client('sso', region_name=region)
+            self.sso_client = _create_client('sso', region)
         return self.sso_client
 
     def detect_region_from_url(self, start_url: str) -> str:
@@ -48,35 +104,16 @@ class SSOAuthHandler:
         Try to detect the SSO region from the start URL.
         For most SSO portals, the region is embedded in the URL or we default to common regions.
         """
-        # Common SSO regions
-        # If URL contains regional indicator, use it
         url_lower = start_url.lower()
         
         # Check for regional AWS apps URLs
         # Format: https://d-xxxxxxxxxx.awsapps.com/start or https://company.awsapps.com/start
+        # AWS SSO uses us-east-1 for global awsapps.com URLs by default,
+        # but some organizations embed a regional indicator in the URL
         if 'awsapps.com' in url_lower:
-            # AWS SSO uses us-east-1 for global awsapps.com URLs by default
-            # But some organizations use regional endpoints
-            
-            # Try to extract region from URL pattern like: https://d-xxxxxxxxxx.awsapps.com/start#/
-            # or check if there's a region subdomain
-            if '.us-east-1.' in url_lower or 'us-east-1' in url_lower:
-                return 'us-east-1'
-            elif '.us-east-2.' in url_lower or 'us-east-2' in url_lower:
-                return 'us-east-2'
-            elif '.us-west-2.' in url_lower or 'us-west-2' in url_lower:
-                return 'us-west-2'
-            elif '.eu-west-1.' in url_lower or 'eu-west-1' in url_lower:
-                return 'eu-west-1'
-            elif '.eu-central-1.' in url_lower or 'eu-central-1' in url_lower:
-                return 'eu-central-1'
-            elif '.ap-southeast-1.' in url_lower or 'ap-southeast-1' in url_lower:
-                return 'ap-southeast-1'
-            elif '.ap-northeast-1.' in url_lower or 'ap-northeast-1' in url_lower:
-                return 'ap-northeast-1'
-            
-            # Default to us-east-1 for awsapps.com
-            return 'us-east-1'
+            match = _REGION_RE.search(url_lower)
+            if match:
+                return match.group(1)
         
         return 'us-east-1'
 
@@ -93,6 +130,7 @@ class SSOAuthHandler:
                 url = url + '/start'
         return url
 
+    @_synchronized
     def register_client(self, region: str) -> Dict[str, str]:
         """Register OIDC client for device authorization"""
         client = self.get_sso_oidc_client(region)
@@ -111,6 +149,7 @@ class SSOAuthHandler:
             'expires_at': response['clientSecretExpiresAt']
         }
     
+    @_synchronized
     def start_device_authorization(self, start_url: str, region: str = None) -> Dict[str, Any]:
         """
         Start device authorization flow.
@@ -146,6 +185,7 @@ class SSOAuthHandler:
             'region': region
         }
     
+    @_synchronized
     def poll_for_token(self, region: str = "us-east-1") -> Dict[str, Any]:
         """
         Poll for token after user completes authorization.
@@ -169,7 +209,11 @@ class SSOAuthHandler:
             
             self.access_token = response['accessToken']
             self.token_expiry = datetime.now() + timedelta(seconds=response['expiresIn'])
-            
+            # Nothing fetched with the previous token is valid for the new login
+            self._accounts_cache.clear()
+            self._roles_cache.clear()
+            self._creds_cache.clear()
+
             return {
                 'status': 'success',
                 'access_token': self.access_token,
@@ -194,11 +238,16 @@ class SSOAuthHandler:
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
     
+    @_synchronized
     def list_accounts(self, region: str = "us-east-1") -> list:
         """List AWS accounts available to the authenticated user"""
         if not self.access_token:
             return []
         
+        cached = self._accounts_cache.get(self.access_token)
+        if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            return cached[1]
+        
         client = self.get_sso_client(region)
         accounts = []
         
@@ -206,16 +255,23 @@ class SSOAuthHandler:
             paginator = client.get_paginator('list_accounts')
             for page in paginator.paginate(accessToken=self.access_token):
                 accounts.extend(page.get('accountList', []))
+            self._accounts_cache[self.access_token] = (time.monotonic(), accounts)
         except Exception as e:
             print(f"Error listing accounts: {e}")
         
         return accounts
     
+    @_synchronized
     def list_account_roles(self, account_id: str, region: str = "us-east-1") -> list:
         """List roles available for a specific account"""
         if not self.access_token:
             return []
         
+        cache_key = (self.access_token, account_id)
+        cached = self._roles_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            return cached[1]
+        
         client = self.get_sso_client(region)
         roles = []
         
@@ -226,16 +282,24 @@ class SSOAuthHandler:
                 accountId=account_id
             ):
                 roles.extend(page.get('roleList', []))
+            self._roles_cache[cache_key] = (time.monotonic(), roles)
         except Exception as e:
             print(f"Error listing roles: {e}")
         
         return roles
     
+    @_synchronized
     def get_role_credentials(self, account_id: str, role_name: str, region: str = "us-east-1") -> Dict[str, Any]:
         """Get temporary credentials for a specific role"""
         if not self.access_token:
             return {'error': 'Not authenticated'}
         
+        # SSO reports expiration as epoch milliseconds
+        cache_key = (self.access_token, account_id, role_name)
+        cached = self._creds_cache.get(cache_key)
+        if cached and cached['expiration'] > time.time() * 1000 + CREDENTIALS_EXPIRY_MARGIN_MS:
+            return cached
+        
         client = self.get_sso_client(region)
         
         try:
@@ -246,12 +310,13 @@ class SSOAuthHandler:
             )
             
             creds = response['roleCredentials']
-            return {
+            self._creds_cache[cache_key] = {
                 'access_key_id': creds['accessKeyId'],
                 'secret_access_key': creds['secretAccessKey'],
                 'session_token': creds['sessionToken'],
                 'expiration': creds['expiration']
             }
+            return self._creds_cache[cache_key]
         except Exception as e:
             return {'error': str(e)}
     
@@ -261,6 +326,7 @@ class SSOAuthHandler:
             return False
         return datetime.now() < self.token_expiry
     
+    @_synchronized
     def reset(self):
         """Reset the SSO handler state"""
         self.sso_oidc_client = None
@@ -271,7 +337,6 @@ class SSOAuthHandler:
         self.access_token = None
         self.token_expiry = None
         self.current_region = None
-
-
-# Global SSO handler instance
-sso_handler = SSOAuthHandler()
+        self._accounts_cache.clear()
+        self._roles_cache.clear()
+        self._creds_cache.clear()
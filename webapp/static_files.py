@@ -0,0 +1,80 @@
+"""
+Precompressed Static Files
+Serves the built frontend assets, preferring the .br/.gz copies written at
+build time (see frontend/scripts/precompress.mjs) when the client accepts them.
+"""
+import os
+import mimetypes
+from typing import List
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles, NotModifiedResponse
+from starlette.types import Scope
+
+# Preferred first; suffix of the precompressed sibling file for each encoding
+PRECOMPRESSED_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Vite fingerprints asset file names, so a given URL never changes content
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _accepted_encodings(accept_encoding: str) -> List[str]:
+    """Encodings listed in an Accept-Encoding header, ignoring those with q=0"""
+    encodings = []
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        params = params.strip()
+
+        quality = 1.0
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                pass
+
+        if name and quality > 0:
+            encodings.append(name)
+    return encodings
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that swaps in foo.js.br / foo.js.gz for foo.js when available"""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        headers = {"Cache-Control": ASSET_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+        response = None
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                compressed_stat = os.stat(str(full_path) + suffix)
+            except OSError:
+                continue
+
+            media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+            response = FileResponse(
+                str(full_path) + suffix,
+                status_code=status_code,
+                stat_result=compressed_stat,
+                media_type=media_type,
+                headers={**headers, "Content-Encoding": encoding},
+            )
+            break
+
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response